@@ -12,18 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import BinaryIO, Iterable, Optional, Tuple, Union
+from typing import BinaryIO, FrozenSet, Iterable, Optional, Tuple, Union
 import unittest
 from collections import defaultdict
 from spinn_utilities.overrides import overrides
+from spinn_utilities.progress_bar import ProgressBar
 from spinn_machine import CoreSubsets
 from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+from spinnman.messages.scp.enums import Signal
 from spinnman.model import ExecutableTargets
 from spinnman.model.enums import CPUState, ExecutableType
 from spinn_front_end_common.data.fec_data_writer import FecDataWriter
 from spinn_front_end_common.interface.config_setup import unittest_setup
 from spinn_front_end_common.interface.interface_functions import (
-    load_app_images)
+    load_app_images, load_sys_images)
 
 SIM = ExecutableType.USES_SIMULATION_INTERFACE
 
@@ -55,6 +57,36 @@ class _MockTransceiver(MockableTransceiver):
         return self._n_cores_in_app[app_id]
 
 
+class _NothingToLoadTransceiver(MockableTransceiver):
+
+    def __init__(self, test_case):
+        self._test_case = test_case
+
+    @overrides(MockableTransceiver.execute_flood)
+    def execute_flood(
+            self, core_subsets: CoreSubsets,
+            executable: Union[BinaryIO, bytes, str], app_id: int, *,
+            n_bytes: Optional[int] = None, wait: bool = False):
+        self._test_case.fail("execute_flood called with nothing to load")
+
+    @overrides(MockableTransceiver.wait_for_cores_to_be_in_state)
+    def wait_for_cores_to_be_in_state(
+            self, all_core_subsets: CoreSubsets, app_id: int,
+            cpu_states: Union[CPUState, Iterable[CPUState]], *,
+            timeout: Optional[float] = None,
+            time_between_polls: float = 0.1,
+            error_states: FrozenSet[CPUState] = frozenset((
+                CPUState.RUN_TIME_EXCEPTION, CPUState.WATCHDOG)),
+            counts_between_full_check: int = 100,
+            progress_bar: Optional[ProgressBar] = None):
+        self._test_case.fail(
+            "wait_for_cores_to_be_in_state called with nothing to load")
+
+    @overrides(MockableTransceiver.send_signal)
+    def send_signal(self, app_id: int, signal: Signal):
+        self._test_case.fail("send_signal called with nothing to load")
+
+
 class TestFrontEndCommonLoadExecutableImages(unittest.TestCase):
 
     def setUp(self):
@@ -73,6 +105,22 @@ class TestFrontEndCommonLoadExecutableImages(unittest.TestCase):
         writer.set_executable_targets(targets)
         load_app_images()
 
+    def test_no_matching_cores(self):
+        writer = FecDataWriter.mock()
+        writer.set_transceiver(_NothingToLoadTransceiver(self))
+        targets = ExecutableTargets()
+        targets.add_processor("test.aplx", 0, 0, 1, SIM)
+        targets.add_processor("test.aplx", 0, 0, 2, SIM)
+        writer.set_executable_targets(targets)
+        # No system binaries, so nothing is loaded, waited for or started
+        load_sys_images()
+
+        targets = ExecutableTargets()
+        targets.add_processor("sys.aplx", 0, 0, 1, ExecutableType.SYSTEM)
+        writer.set_executable_targets(targets)
+        # No application binaries, so nothing is loaded, waited for or started
+        load_app_images()
+
 
 if __name__ == "__main__":
     unittest.main()
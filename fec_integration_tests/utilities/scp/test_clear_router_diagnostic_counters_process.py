@@ -0,0 +1,65 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import struct
+from spinnman.processes import RoundRobinConnectionSelector
+from spinnman.messages.scp.enums import SCPCommand
+from spinnman.messages.sdp import SDPHeader
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.utilities.scp import (
+    ClearRouterDiagnosticCountersProcess)
+from fec_integration_tests.mock_machine import MockMachine
+
+
+class TestClearRouterDiagnosticCountersProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_clear_router_diagnostic_counters(self):
+        receiver = MockMachine()
+        receiver.start()
+
+        # Set up a connection to the "machine"
+        connection = SCAMPConnection(
+            0, 0, remote_host="127.0.0.1", remote_port=receiver.local_port)
+        selector = RoundRobinConnectionSelector([connection])
+
+        # Create the process and run it
+        chips = [(0, 0), (1, 0), (0, 1)]
+        process = ClearRouterDiagnosticCountersProcess(selector)
+        process.clear_router_diagnostic_counters(chips)
+        receiver.stop()
+
+        # Check one write of all ones to the clear register per chip
+        cleared = list()
+        while receiver.is_next_message:
+            data = receiver.next_message
+            sdp_header = SDPHeader.from_bytestring(data, 2)
+            cleared.append((
+                sdp_header.destination_chip_x, sdp_header.destination_chip_y))
+            command, _sequence, address, size = struct.unpack_from(
+                "<2H2I", data, 10)
+            self.assertEqual(command, SCPCommand.CMD_WRITE.value)
+            self.assertEqual(address, 0xf100002c)
+            self.assertEqual(size, 4)
+            value, = struct.unpack_from("<I", data, 26)
+            self.assertEqual(value, 0xFFFFFFFF)
+        self.assertEqual(sorted(cleared), sorted(chips))
+
+
+if __name__ == "__main__":
+    unittest.main()
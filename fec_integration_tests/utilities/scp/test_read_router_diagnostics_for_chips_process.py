@@ -0,0 +1,126 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import struct
+import unittest
+from spinnman.exceptions import (
+    SpinnmanGenericProcessException, SpinnmanUnexpectedResponseCodeException)
+from spinnman.messages.scp.enums import SCPResult
+from spinnman.processes import FixedConnectionSelector
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.utilities.scp import (
+    ReadRouterDiagnosticsForChipsProcess)
+
+_CONTROL_REGISTER_ADDRESS = 0xe1000000
+_ERROR_STATUS_ADDRESS = 0xe1000014
+_DIAGNOSTIC_REGISTERS_ADDRESS = 0xe1000300
+
+
+def _words(x, y, address, size):
+    if address == _CONTROL_REGISTER_ADDRESS:
+        return [(x + 1) << 8]
+    if address == _ERROR_STATUS_ADDRESS:
+        return [y]
+    assert address == _DIAGNOSTIC_REGISTERS_ADDRESS
+    return [x * 100 + y * 10 + i for i in range(size // 4)]
+
+
+class _MockConnection(object):
+    """
+    Answers each read of router registers immediately, except on the chips
+    it is told are broken or that give a reply too short to read.
+    """
+
+    def __init__(self, failing=(), garbled=()):
+        self._failing = failing
+        self._garbled = garbled
+        self._responses = deque()
+
+    def is_ready_to_receive(self, timeout=0):
+        return bool(self._responses)
+
+    def get_scp_data(self, request):
+        request.sdp_header.update_for_send(0, 0)
+        header = request.sdp_header
+        x, y = header.destination_chip_x, header.destination_chip_y
+        sequence = request.scp_request_header.sequence
+        response = struct.pack("<2x") + header.bytestring
+        if (x, y) in self._failing:
+            response += struct.pack(
+                "<2H", SCPResult.RC_ROUTE.value, sequence)
+        elif ((x, y) in self._garbled and
+                request.argument_1 == _ERROR_STATUS_ADDRESS):
+            # Too short to hold the requested word
+            response += struct.pack("<2H", SCPResult.RC_OK.value, sequence)
+        else:
+            words = _words(x, y, request.argument_1, request.argument_2)
+            response += struct.pack(
+                f"<2H{len(words)}I", SCPResult.RC_OK.value, sequence,
+                *words)
+        self._responses.append(response)
+        return b""
+
+    def send(self, data):
+        pass
+
+    def receive_scp_response(self, timeout=1.0):
+        data = self._responses.popleft()
+        result, sequence = struct.unpack_from("<2H", data, 10)
+        return SCPResult(result), sequence, data, 2
+
+
+class TestReadRouterDiagnosticsForChipsProcess(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+
+    def test_read_all(self):
+        chips = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        process = ReadRouterDiagnosticsForChipsProcess(
+            FixedConnectionSelector(_MockConnection()))
+        diagnostics = process.get_router_diagnostics(chips)
+        self.assertEqual(set(chips), set(diagnostics))
+        self.assertEqual(dict(), process.failures)
+        for (x, y), chip_diagnostics in diagnostics.items():
+            self.assertEqual(x + 1, chip_diagnostics.mon)
+            self.assertEqual(y, chip_diagnostics.error_status)
+            self.assertEqual(
+                x * 100 + y * 10,
+                chip_diagnostics.n_local_multicast_packets)
+            self.assertEqual(
+                x * 100 + y * 10 + 15, chip_diagnostics.user_3)
+
+    def test_failed_chips(self):
+        chips = [(0, 0), (1, 0), (0, 1), (1, 1)]
+        process = ReadRouterDiagnosticsForChipsProcess(
+            FixedConnectionSelector(_MockConnection(failing={(1, 0)})))
+        diagnostics = process.get_router_diagnostics(chips)
+        self.assertEqual({(0, 0), (0, 1), (1, 1)}, set(diagnostics))
+        self.assertEqual({(1, 0)}, set(process.failures))
+        self.assertIsInstance(
+            process.failures[1, 0], SpinnmanUnexpectedResponseCodeException)
+        self.assertEqual(2, diagnostics[1, 1].mon)
+        self.assertEqual(1, diagnostics[1, 1].error_status)
+
+    def test_other_errors_raised(self):
+        process = ReadRouterDiagnosticsForChipsProcess(
+            FixedConnectionSelector(_MockConnection(garbled={(1, 1)})))
+        with self.assertRaises(SpinnmanGenericProcessException):
+            process.get_router_diagnostics([(0, 0), (1, 1)])
+        self.assertEqual(dict(), process.failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,8 +35,9 @@ class MachineDataSpecableVertex(
     def generate_data_specification(
             self, spec: DataSpecificationGenerator, placement: Placement):
         tags = FecDataView.get_tags()
-        iptags = tags.get_ip_tags_for_vertex(placement.vertex)
-        reverse_iptags = tags.get_reverse_ip_tags_for_vertex(placement.vertex)
+        vertex = placement.vertex
+        iptags = tags.get_ip_tags_for_vertex(vertex)
+        reverse_iptags = tags.get_reverse_ip_tags_for_vertex(vertex)
         self.generate_machine_data_specification(
             spec, placement, iptags, reverse_iptags)
 
@@ -15,7 +15,8 @@ from __future__ import annotations  # Type checking trickery
 import logging
 import os
 from typing import (
-    Dict, Iterable, Iterator, Optional, Set, Tuple, Union, List, TYPE_CHECKING)
+    Dict, Iterable, Iterator, NamedTuple, Optional, Set, Tuple, Union, List,
+    TYPE_CHECKING)
 
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.socket_address import SocketAddress
@@ -54,6 +55,24 @@ _EMPTY_CORE_SUBSETS = CoreSubsets()
 hash(_EMPTY_CORE_SUBSETS)
 
 
+class _SimulationTimeStep(NamedTuple):
+    """
+    The simulation time step and the values derived from it.
+
+    These are always set and cleared together so are held as one object.
+    """
+    #: The simulation time step in microseconds
+    us: int
+    #: The simulation time step in milliseconds
+    ms: float
+    #: The number of simulation time steps in a millisecond
+    per_ms: float
+    #: The number of simulation time steps in a second
+    per_s: float
+    #: The simulation time step in seconds
+    s: float
+
+
 # pylint: disable=protected-access
 class _FecDataModel(object):
     """
@@ -106,11 +125,7 @@ class _FecDataModel(object):
         "_reset_number",
         "_run_number",
         "_run_step",
-        "_simulation_time_step_ms",
-        "_simulation_time_step_per_ms",
-        "_simulation_time_step_per_s",
-        "_simulation_time_step_s",
-        "_simulation_time_step_us",
+        "_simulation_time_step",
         "_spalloc_job",
         "_system_multicast_router_timeout_keys",
         "_timestamp_dir_path",
@@ -147,11 +162,7 @@ class _FecDataModel(object):
         self._none_labelled_edge_count = 0
         self._reset_number = 0
         self._run_number: Optional[int] = None
-        self._simulation_time_step_ms: Optional[float] = None
-        self._simulation_time_step_per_ms: Optional[float] = None
-        self._simulation_time_step_per_s: Optional[float] = None
-        self._simulation_time_step_s: Optional[float] = None
-        self._simulation_time_step_us: Optional[int] = None
+        self._simulation_time_step: Optional[_SimulationTimeStep] = None
         self._time_scale_factor: Optional[Union[int, float]] = None
         self._timestamp_dir_path: Optional[str] = None
         self._hard_reset()
@@ -194,6 +205,15 @@ class _FecDataModel(object):
         self._first_machine_time_step = 0
         self._run_step: Optional[int] = None
 
+    def _clear_timings(self) -> None:
+        """
+        Clears the simulation and hardware time step data.
+        """
+        self._simulation_time_step = None
+        self._time_scale_factor = None
+        self._hardware_time_step_ms = None
+        self._hardware_time_step_us = None
+
     def _clear_notification_protocol(self) -> None:
         if self._notification_protocol:
             try:
@@ -367,7 +387,7 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
 
         :rtype: bool
         """
-        return cls.__fec_data._simulation_time_step_us is not None
+        return cls.__fec_data._simulation_time_step is not None
 
     @classmethod
     def get_simulation_time_step_us(cls) -> int:
@@ -380,9 +400,10 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
         :raises ~spinn_utilities.exceptions.SpiNNUtilsException:
             If the simulation_time_step_us is currently unavailable
         """
-        if cls.__fec_data._simulation_time_step_us is None:
+        time_step = cls.__fec_data._simulation_time_step
+        if time_step is None:
             raise cls._exception("simulation_time_step_us")
-        return cls.__fec_data._simulation_time_step_us
+        return time_step.us
 
     @classmethod
     def get_simulation_time_step_s(cls) -> float:
@@ -395,9 +416,10 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
         :raises ~spinn_utilities.exceptions.SpiNNUtilsException:
             If the simulation_time_step_ms is currently unavailable
         """
-        if cls.__fec_data._simulation_time_step_s is None:
+        time_step = cls.__fec_data._simulation_time_step
+        if time_step is None:
             raise cls._exception("simulation_time_step_s")
-        return cls.__fec_data._simulation_time_step_s
+        return time_step.s
 
     @classmethod
     def get_simulation_time_step_ms(cls) -> float:
@@ -410,9 +432,10 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
         :raises ~spinn_utilities.exceptions.SpiNNUtilsException:
             If the simulation_time_step_ms is currently unavailable
         """
-        if cls.__fec_data._simulation_time_step_ms is None:
+        time_step = cls.__fec_data._simulation_time_step
+        if time_step is None:
             raise cls._exception("simulation_time_step_ms")
-        return cls.__fec_data._simulation_time_step_ms
+        return time_step.ms
 
     @classmethod
     def get_simulation_time_step_per_ms(cls) -> float:
@@ -425,9 +448,10 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
         :raises ~spinn_utilities.exceptions.SpiNNUtilsException:
             If the simulation_time_step is currently unavailable
         """
-        if cls.__fec_data._simulation_time_step_per_ms is None:
+        time_step = cls.__fec_data._simulation_time_step
+        if time_step is None:
             raise cls._exception("simulation_time_step_per_ms")
-        return cls.__fec_data._simulation_time_step_per_ms
+        return time_step.per_ms
 
     @classmethod
     def get_simulation_time_step_per_s(cls) -> float:
@@ -440,9 +464,10 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
         :raises ~spinn_utilities.exceptions.SpiNNUtilsException:
             If the simulation_time_step is currently unavailable
         """
-        if cls.__fec_data._simulation_time_step_per_s is None:
+        time_step = cls.__fec_data._simulation_time_step
+        if time_step is None:
             raise cls._exception("simulation_time_step_per_s")
-        return cls.__fec_data._simulation_time_step_per_s
+        return time_step.per_s
 
     @classmethod
     def get_hardware_time_step_ms(cls) -> float:
@@ -14,7 +14,6 @@
 
 import datetime
 import logging
-import math
 import os
 import time
 from typing import Dict, Optional, Tuple
@@ -44,12 +43,12 @@ from spinn_front_end_common.utility_models import (
     DataSpeedUpPacketGatherMachineVertex, ExtraMonitorSupportMachineVertex)
 from spinn_front_end_common.abstract_models.impl import (
     MachineAllocationController)
-from .fec_data_view import FecDataView, _FecDataModel
+from .fec_data_view import FecDataView, _FecDataModel, _SimulationTimeStep
 
 logger = FormatAdapter(logging.getLogger(__name__))
-__temp_dir = None
 
 REPORTS_DIRNAME = "reports"
+_MICRO_PER_MILLI = int(MICRO_TO_MILLISECOND_CONVERSION)
 
 
 class FecDataWriter(PacmanDataWriter, SpiNNManDataWriter, FecDataView):
@@ -237,14 +236,7 @@ class FecDataWriter(PacmanDataWriter, SpiNNManDataWriter, FecDataView):
                 time_scale_factor, default_time_scale_factor)
             self._set_hardware_timestep()
         except ConfigurationException:
-            self.__fec_data._simulation_time_step_us = None
-            self.__fec_data._simulation_time_step_ms = None
-            self.__fec_data._simulation_time_step_per_ms = None
-            self.__fec_data._simulation_time_step_per_s = None
-            self.__fec_data._simulation_time_step_s = None
-            self.__fec_data._time_scale_factor = None
-            self.__fec_data._hardware_time_step_us = None
-            self.__fec_data._hardware_time_step_ms = None
+            self.__fec_data._clear_timings()
             raise
 
     def _set_simulation_time_step(
@@ -267,15 +259,12 @@ class FecDataWriter(PacmanDataWriter, SpiNNManDataWriter, FecDataView):
                 f'invalid simulation_time_step {simulation_time_step_us}'
                 ': must greater than zero')
 
-        self.__fec_data._simulation_time_step_us = simulation_time_step_us
-        self.__fec_data._simulation_time_step_ms = (
-                simulation_time_step_us / MICRO_TO_MILLISECOND_CONVERSION)
-        self.__fec_data._simulation_time_step_per_ms = (
-                MICRO_TO_MILLISECOND_CONVERSION / simulation_time_step_us)
-        self.__fec_data._simulation_time_step_per_s = (
-                MICRO_TO_SECOND_CONVERSION / simulation_time_step_us)
-        self.__fec_data._simulation_time_step_s = (
-                simulation_time_step_us / MICRO_TO_SECOND_CONVERSION)
+        self.__fec_data._simulation_time_step = _SimulationTimeStep(
+            us=simulation_time_step_us,
+            ms=simulation_time_step_us / MICRO_TO_MILLISECOND_CONVERSION,
+            per_ms=MICRO_TO_MILLISECOND_CONVERSION / simulation_time_step_us,
+            per_s=MICRO_TO_SECOND_CONVERSION / simulation_time_step_us,
+            s=simulation_time_step_us / MICRO_TO_SECOND_CONVERSION)
 
     def _set_time_scale_factor(
             self, time_scale_factor: Optional[float],
@@ -306,13 +295,14 @@ class FecDataWriter(PacmanDataWriter, SpiNNManDataWriter, FecDataView):
                 time_scale_factor = default_time_scale_factor
 
         if time_scale_factor is None:
-            time_scale_factor = max(
-                1.0, math.ceil(self.get_simulation_time_step_per_ms()))
-            if time_scale_factor > 1.0:
+            # Ceiling of the time steps per millisecond, done in integers
+            time_step_us = self.get_simulation_time_step_us()
+            time_scale_factor = max(1, -(-_MICRO_PER_MILLI // time_step_us))
+            if time_scale_factor > 1:
                 logger.warning(
                     "A timestep was entered that has forced SpiNNaker to "
                     "automatically slow the simulation down from real time "
-                    f"by a factor of {time_scale_factor}.")
+                    "by a factor of {}.", time_scale_factor)
 
         if not isinstance(time_scale_factor, (int, float)):
             raise TypeError("app_id should be an int (or float)")
@@ -325,21 +315,25 @@ class FecDataWriter(PacmanDataWriter, SpiNNManDataWriter, FecDataView):
         self.__fec_data._time_scale_factor = time_scale_factor
 
     def _set_hardware_timestep(self) -> None:
-        raw = (self.get_simulation_time_step_us() *
-               self.get_time_scale_factor())
-        rounded = round(raw)
-        if abs(rounded - raw) > 0.0001:
-            raise ConfigurationException(
-                "The multiplication of simulation time step in microseconds: "
-                f"{self.get_simulation_time_step_us()} and times scale factor"
-                f": {self.get_time_scale_factor()} produced a non integer "
-                f"hardware time step of {raw}")
+        time_step_us = self.get_simulation_time_step_us()
+        time_scale_factor = self.get_time_scale_factor()
+        if isinstance(time_scale_factor, int):
+            # Integer product so exact; no rounding check needed
+            rounded = time_step_us * time_scale_factor
+        else:
+            raw = time_step_us * time_scale_factor
+            rounded = round(raw)
+            if abs(rounded - raw) > 0.0001:
+                raise ConfigurationException(
+                    "The multiplication of simulation time step in "
+                    f"microseconds: {time_step_us} and times scale factor"
+                    f": {time_scale_factor} produced a non integer "
+                    f"hardware time step of {raw}")
 
         logger.info(
             "Setting hardware timestep as {} microseconds based on "
             "simulation time step of {} and timescale factor of {}",
-            rounded, self.get_simulation_time_step_us(),
-            self.get_time_scale_factor())
+            rounded, time_step_us, time_scale_factor)
         self.__fec_data._hardware_time_step_us = rounded
         self.__fec_data._hardware_time_step_ms = (
             rounded / MICRO_TO_MILLISECOND_CONVERSION)
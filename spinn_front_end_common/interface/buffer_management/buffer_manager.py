@@ -100,9 +100,6 @@ class BufferManager(object):
     def __init__(self) -> None:
         self.__enable_monitors: bool = get_config_bool(
             "Machine", "enable_advanced_monitor_support") or False
-        # Set of vertices with buffers to be sent
-        self._sender_vertices: Set[AbstractSendsBuffersFromHost] = set()
-
         # Dictionary of sender vertex -> buffers sent
         self._sent_messages: Dict[
             AbstractSendsBuffersFromHost, BuffersSentDeque] = dict()
@@ -117,11 +114,14 @@ class BufferManager(object):
         else:
             self._java_caller = None
 
-        for placement in FecDataView.iterate_placements_by_vertex_type(
-                AbstractSendsBuffersFromHost):
-            vertex = cast(AbstractSendsBuffersFromHost, placement.vertex)
-            if vertex.buffering_input():
-                self._sender_vertices.add(vertex)
+        # Set of vertices with buffers to be sent; the placements are
+        # already filtered by type so only the buffering check remains
+        senders = (
+            cast(AbstractSendsBuffersFromHost, placement.vertex)
+            for placement in FecDataView.iterate_placements_by_vertex_type(
+                AbstractSendsBuffersFromHost))
+        self._sender_vertices: Set[AbstractSendsBuffersFromHost] = {
+            vertex for vertex in senders if vertex.buffering_input()}
 
     def _request_data(
             self, placement_x: int, placement_y: int, address: int,
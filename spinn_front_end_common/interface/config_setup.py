@@ -20,6 +20,7 @@ from pacman.config_setup import add_pacman_cfg
 from spinn_front_end_common.data.fec_data_writer import FecDataWriter
 
 BASE_CONFIG_FILE = "spinnaker.cfg"
+_BASE_CONFIG_PATH = os.path.join(os.path.dirname(__file__), BASE_CONFIG_FILE)
 
 
 def unittest_setup() -> None:
@@ -45,4 +46,4 @@ def add_spinnaker_cfg() -> None:
     """
     add_pacman_cfg()  # This add its dependencies too
     add_spinnman_cfg()  # double adds of dependencies ignored
-    add_default_cfg(os.path.join(os.path.dirname(__file__), BASE_CONFIG_FILE))
+    add_default_cfg(_BASE_CONFIG_PATH)
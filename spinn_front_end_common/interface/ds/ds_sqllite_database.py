@@ -62,8 +62,11 @@ class DsSqlliteDatabase(SQLiteDB):
 
         self._init_file = not os.path.exists(database_file)
 
+        # As in the DDL, commits need not wait for the disk; the data is
+        # regenerated on every run
         super().__init__(
-            database_file, ddl_file=_DDL_FILE if self._init_file else None)
+            database_file, ddl_file=_DDL_FILE if self._init_file else None,
+            synchronous=False)
 
     def _context_entered(self):
         super()._context_entered()
@@ -159,7 +162,7 @@ class DsSqlliteDatabase(SQLiteDB):
                 LIMIT 1
                 """, (x, y)):
             return
-        chip = FecDataView().get_chip_at(x, y)
+        chip = FecDataView.get_chip_at(x, y)
         self.execute(
             """
             INSERT INTO chip(x, y, ethernet_x, ethernet_y) VALUES(?, ?, ?, ?)
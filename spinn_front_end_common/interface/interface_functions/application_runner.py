@@ -14,14 +14,17 @@
 
 import logging
 import time
-from typing import Optional
+from typing import Dict, Optional
 from spinn_utilities.log import FormatAdapter
 from spinnman.messages.scp.enums import Signal
+from spinn_machine import CoreSubsets
 from spinnman.model.enums import ExecutableType
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.constants import (
     MICRO_TO_MILLISECOND_CONVERSION)
+from spinn_front_end_common.utilities.scp import (
+    ClearRouterDiagnosticCountersProcess)
 
 SAFETY_FINISH_TIME = 0.1
 
@@ -68,8 +71,11 @@ class _ApplicationRunner(object):
         """
         logger.info("*** Running simulation... *** ")
 
+        # the executable types do not change during a run, so fetch once
+        exec_types = FecDataView.get_executable_types()
+
         # wait for all cores to be ready
-        self._wait_for_start()
+        self._wait_for_start(exec_types)
 
         buffer_manager = FecDataView.get_buffer_manager()
         notification_interface = FecDataView.get_notification_protocol()
@@ -82,15 +88,17 @@ class _ApplicationRunner(object):
 
         # clear away any router diagnostics that have been set due to all
         # loading applications
-        for chip in FecDataView.get_machine().chips:
-            self.__txrx.clear_router_diagnostic_counters(chip.x, chip.y)
+        process = ClearRouterDiagnosticCountersProcess(
+            FecDataView.get_scamp_connection_selector())
+        process.clear_router_diagnostic_counters(
+            FecDataView.get_machine().chip_coordinates)
 
         # wait till external app is ready for us to start if required
         notification_interface.wait_for_confirmation()
 
         # set off the executables that are in sync state
         # (sending to all is just as safe)
-        self._send_sync_signal()
+        self._send_sync_signal(exec_types)
 
         # Send start notification to external applications
         notification_interface.send_start_resume_notification()
@@ -101,15 +109,17 @@ class _ApplicationRunner(object):
         else:
             # Wait for the application to finish
             self._run_wait(
-                run_until_complete, runtime, time_threshold)
+                exec_types, run_until_complete, runtime, time_threshold)
 
             # Send stop notification to external applications
             notification_interface.send_stop_pause_notification()
 
     def _run_wait(
-            self, run_until_complete: bool, runtime: Optional[float],
+            self, exec_types: Dict[ExecutableType, CoreSubsets],
+            run_until_complete: bool, runtime: Optional[float],
             time_threshold: Optional[float]):
         """
+        :param dict(ExecutableType,~spinn_machine.CoreSubsets) exec_types:
         :param bool run_until_complete:
         :param int runtime:
         :param float time_threshold:
@@ -124,69 +134,83 @@ class _ApplicationRunner(object):
                 "Application started; waiting {}s for it to stop",
                 time_to_wait)
             time.sleep(time_to_wait)
-            self._wait_for_end(timeout=time_threshold)
+            self._wait_for_end(exec_types, timeout=time_threshold)
         else:
             logger.info("Application started; waiting until finished")
-            self._wait_for_end()
+            self._wait_for_end(exec_types)
 
-    def _wait_for_start(self, timeout: Optional[float] = None):
+    def _wait_for_start(
+            self, exec_types: Dict[ExecutableType, CoreSubsets],
+            timeout: Optional[float] = None):
         """
+        :param dict(ExecutableType,~spinn_machine.CoreSubsets) exec_types:
         :param timeout:
         :type timeout: float or None
         """
-        for ex_type, cores in FecDataView.get_executable_types().items():
-            self.__txrx.wait_for_cores_to_be_in_state(
-                cores, self.__app_id, ex_type.start_state, timeout=timeout)
-
-    def _send_sync_signal(self) -> None:
+        txrx = self.__txrx
+        app_id = self.__app_id
+        for ex_type, cores in exec_types.items():
+            txrx.wait_for_cores_to_be_in_state(
+                cores, app_id, ex_type.start_state, timeout=timeout)
+
+    def _send_sync_signal(
+            self, exec_types: Dict[ExecutableType, CoreSubsets]) -> None:
         """
         Let apps that use the simulation interface or sync signals commence
         running their main processing loops. This is done with a very fast
         synchronisation barrier and a signal.
+
+        :param dict(ExecutableType,~spinn_machine.CoreSubsets) exec_types:
         """
-        executable_types = FecDataView.get_executable_types().keys()
-        if (ExecutableType.USES_SIMULATION_INTERFACE in executable_types
-                or ExecutableType.SYNC in executable_types):
+        if (ExecutableType.USES_SIMULATION_INTERFACE in exec_types
+                or ExecutableType.SYNC in exec_types):
             # locate all signals needed to set off executables
-            sync_signal = self._determine_simulation_sync_signals()
+            sync_signal = self._determine_simulation_sync_signals(exec_types)
 
             if sync_signal is not None:
                 # fire all signals as required
                 self.__txrx.send_signal(self.__app_id, sync_signal)
 
-    def _wait_for_end(self, timeout: Optional[float] = None):
+    def _wait_for_end(
+            self, exec_types: Dict[ExecutableType, CoreSubsets],
+            timeout: Optional[float] = None):
         """
+        :param dict(ExecutableType,~spinn_machine.CoreSubsets) exec_types:
         :param timeout:
         :type timeout: float or None
         """
-        for ex_type, cores in FecDataView.get_executable_types().items():
-            self.__txrx.wait_for_cores_to_be_in_state(
-                cores, self.__app_id, ex_type.end_state, timeout=timeout)
-
-    def _determine_simulation_sync_signals(self) -> Optional[Signal]:
+        txrx = self.__txrx
+        app_id = self.__app_id
+        for ex_type, cores in exec_types.items():
+            txrx.wait_for_cores_to_be_in_state(
+                cores, app_id, ex_type.end_state, timeout=timeout)
+
+    def _determine_simulation_sync_signals(
+            self, exec_types: Dict[ExecutableType, CoreSubsets]
+            ) -> Optional[Signal]:
         """
         Determines the start states, and creates core subsets of the
         states for further checks.
 
+        :param dict(ExecutableType,~spinn_machine.CoreSubsets) exec_types:
         :return: the sync signal
         :rtype: ~.Signal
         :raises ConfigurationException:
         """
-        sync_signal = None
-
-        executable_types = FecDataView.get_executable_types().keys()
-        if ExecutableType.USES_SIMULATION_INTERFACE in executable_types:
-            sync_signal = FecDataView.get_next_sync_signal()
+        uses_simulation = (
+            ExecutableType.USES_SIMULATION_INTERFACE in exec_types)
+        if ExecutableType.SYNC not in exec_types:
+            if uses_simulation:
+                return FecDataView.get_next_sync_signal()
+            return None
 
         # handle the sync states, but only send once if they work with
         # the simulation interface requirement
-        if ExecutableType.SYNC in executable_types:
-            if sync_signal == Signal.SYNC1:
-                raise ConfigurationException(
-                    "There can only be one SYNC signal per run. This is "
-                    "because we cannot ensure the cores have not reached the "
-                    "next SYNC state before we send the next SYNC, resulting "
-                    "in uncontrolled behaviour")
-            sync_signal = Signal.SYNC0
-
-        return sync_signal
+        if uses_simulation and (
+                FecDataView.get_next_sync_signal() == Signal.SYNC1):
+            raise ConfigurationException(
+                "There can only be one SYNC signal per run. This is "
+                "because we cannot ensure the cores have not reached the "
+                "next SYNC state before we send the next SYNC, resulting "
+                "in uncontrolled behaviour")
+        return Signal.SYNC0
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
 import logging
 from time import sleep
 from spinn_utilities.progress_bar import ProgressBar
@@ -23,7 +22,6 @@ from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 
 logger = FormatAdapter(logging.getLogger(__name__))
-_ONE_WORD = struct.Struct("<I")
 
 _LIMIT = 10
 
@@ -96,16 +94,19 @@ class _ChipProvenanceUpdater(object):
         """
         # pylint: disable=too-many-arguments
         left_to_do_cores = total_processors - processors_completed
+        txrx = self.__txrx
+        send_update = txrx.send_chip_update_provenance_and_exit
         attempts = 0
         while processors_completed != total_processors and attempts < _LIMIT:
             attempts += 1
-            unsuccessful_cores = self.__txrx.get_cpu_infos(
+            unsuccessful_cores = txrx.get_cpu_infos(
                 self.__all_cores, CPUState.FINISHED, False)
 
+            # These are fire-and-forget SDP sends, so no reply is awaited
             for (x, y, p) in unsuccessful_cores:
-                self.__txrx.send_chip_update_provenance_and_exit(x, y, p)
+                send_update(x, y, p)
 
-            processors_completed = self.__txrx.get_core_state_count(
+            processors_completed = txrx.get_core_state_count(
                 self.__app_id, CPUState.FINISHED)
 
             left_over_now = total_processors - processors_completed
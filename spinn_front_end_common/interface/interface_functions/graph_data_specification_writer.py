@@ -21,7 +21,7 @@ from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
 from pacman.model.graphs import AbstractVertex
 from pacman.model.graphs.machine import MachineVertex
-from pacman.model.resources import MultiRegionSDRAM, ConstantSDRAM
+from pacman.model.resources import MultiRegionSDRAM
 from pacman.model.placements import Placement
 from spinn_front_end_common.abstract_models import (
     AbstractRewritesDataSpecification, AbstractGeneratesDataSpecification)
@@ -104,13 +104,13 @@ class _GraphDataSpecificationWriter(object):
 
                 # If the spec wasn't generated directly, and there is an
                 # application vertex, try with that
-                if not generated and vertex.app_vertex is not None:
-                    generated = self.__generate_data_spec_for_vertices(
-                        placement, vertex.app_vertex, ds_db)
-                    if generated and isinstance(
-                            vertex.app_vertex,
-                            AbstractRewritesDataSpecification):
-                        vertices_to_reset.append(vertex.app_vertex)
+                app_vertex = vertex.app_vertex
+                if generated or app_vertex is None:
+                    continue
+                if self.__generate_data_spec_for_vertices(
+                        placement, app_vertex, ds_db) and isinstance(
+                            app_vertex, AbstractRewritesDataSpecification):
+                    vertices_to_reset.append(app_vertex)
 
             # Ensure that the vertices know their regions have been reloaded
             for rewriter in vertices_to_reset:
@@ -135,9 +135,7 @@ class _GraphDataSpecificationWriter(object):
         if not isinstance(vertex, AbstractGeneratesDataSpecification):
             return False
 
-        x = placement.x
-        y = placement.y
-        p = placement.p
+        x, y, p = placement.x, placement.y, placement.p
 
         report_writer = get_report_writer(x, y, p)
         spec = DataSpecificationGenerator(
@@ -147,7 +145,8 @@ class _GraphDataSpecificationWriter(object):
         vertex.generate_data_specification(spec, placement)
 
         # Check the memory usage
-        total_size = ds_db.get_total_regions_size(x, y, p)
+        region_sizes = ds_db.get_region_sizes(x, y, p)
+        total_size = sum(region_sizes.values())
         region_size = APP_PTR_TABLE_BYTE_SIZE + total_size
         total_est_size = 0
 
@@ -155,11 +154,12 @@ class _GraphDataSpecificationWriter(object):
         if isinstance(vertex, MachineVertex):
             sdram = vertex.sdram_required
             if isinstance(sdram, MultiRegionSDRAM):
-                region_sizes = ds_db.get_region_sizes(x, y, p)
+                n_timesteps = FecDataView.get_max_run_time_steps()
+                estimates = sdram.regions
                 for i, size in region_sizes.items():
-                    est_size = sdram.regions.get(i, ConstantSDRAM(0))
-                    est_size = est_size.get_total_sdram(
-                        FecDataView.get_max_run_time_steps())
+                    estimate = estimates.get(i)
+                    est_size = (0 if estimate is None
+                                else estimate.get_total_sdram(n_timesteps))
                     total_est_size += est_size
                     if size > est_size:
                         logger.warning(
@@ -168,9 +168,9 @@ class _GraphDataSpecificationWriter(object):
                             i, vertex.label, est_size, size)
 
         self._vertices_by_chip[x, y].append(vertex)
-        self._sdram_usage[x, y] += total_size
-        if (self._sdram_usage[x, y] <=
-                FecDataView().get_chip_at(x, y).sdram):
+        chip_usage = self._sdram_usage[x, y] + total_size
+        self._sdram_usage[x, y] = chip_usage
+        if chip_usage <= FecDataView.get_chip_at(x, y).sdram:
             return True
 
         # creating the error message which contains the memory usage of
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import logging
+import struct
 from typing import Any, Callable
 
 import numpy
@@ -26,7 +27,8 @@ from spinnman.model.enums import UserRegister
 
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.constants import (
-    APPDATA_MAGIC_NUM, APP_PTR_TABLE_BYTE_SIZE, BYTES_PER_WORD,
+    APPDATA_MAGIC_NUM, APP_PTR_TABLE_BYTE_SIZE,
+    APP_PTR_TABLE_HEADER_BYTE_SIZE, BYTES_PER_WORD,
     CORE_DATA_SDRAM_BASE_TAG, DSE_VERSION, MAX_MEM_REGIONS, TABLE_TYPE)
 from spinn_front_end_common.utilities.exceptions import DataSpecException
 from spinn_front_end_common.utilities.emergency_recovery import (
@@ -35,6 +37,7 @@ from spinn_front_end_common.interface.ds import DsSqlliteDatabase
 
 logger = FormatAdapter(logging.getLogger(__name__))
 _Writer: TypeAlias = Callable[[int, int, int, bytes], Any]
+_HEADER = struct.Struct("<II")
 
 
 def load_system_data_specs() -> None:
@@ -56,12 +59,7 @@ def load_application_data_specs() -> None:
     if get_config_bool(
             "Machine", "disable_advanced_monitor_usage_for_data_in"):
         uses_advanced_monitors = False
-    try:
-        specifier.load_data_specs(False, uses_advanced_monitors)
-    except:  # noqa: E722
-        if uses_advanced_monitors:
-            emergency_recover_states_from_failure()
-        raise
+    specifier.load_data_specs(False, uses_advanced_monitors)
 
 
 class _LoadDataSpecification(object):
@@ -118,7 +116,7 @@ class _LoadDataSpecification(object):
                     self.__java_app(uses_advanced_monitors)
             else:
                 self.__python_load(is_system, uses_advanced_monitors)
-        except:  # noqa: E722
+        except Exception:
             if uses_advanced_monitors:
                 emergency_recover_states_from_failure()
             raise
@@ -158,15 +156,24 @@ class _LoadDataSpecification(object):
                 "Executing data specifications and loading data for "
                 f"{type_str} vertices")
 
-            for x, y, p, _, _ in progress.over(
-                    core_infos, finish_at_end=False):
-                self.__python_malloc_core(ds_database, x, y, p)
+            # Keep the start addresses rather than reading them back later
+            start_addresses = {
+                (x, y, p): self.__python_malloc_core(ds_database, x, y, p)
+                for x, y, p, _, _ in progress.over(
+                    core_infos, finish_at_end=False)}
+
+            # The header and pointer table share one buffer, reused for
+            # every core; each writer is given its own copy as it may keep it
+            table_data = bytearray(APP_PTR_TABLE_BYTE_SIZE)
+            _HEADER.pack_into(table_data, 0, APPDATA_MAGIC_NUM, DSE_VERSION)
 
             for x, y, p, eth_x, eth_y in progress.over(core_infos):
                 if uses_advanced_monitors:
                     gatherer = FecDataView.get_gatherer_by_xy(eth_x, eth_y)
                     writer = gatherer.send_data_into_spinnaker
-                written = self.__python_load_core(ds_database, x, y, p, writer)
+                written = self.__python_load_core(
+                    ds_database, x, y, p, start_addresses[x, y, p],
+                    table_data, writer)
                 to_write = ds_database.get_memory_to_write(x, y, p)
                 if written != to_write:
                     raise DataSpecException(
@@ -176,7 +183,8 @@ class _LoadDataSpecification(object):
             self.__reset_router_timeouts()
 
     def __python_malloc_core(
-            self, ds_database: DsSqlliteDatabase, x: int, y: int, p: int):
+            self, ds_database: DsSqlliteDatabase, x: int, y: int,
+            p: int) -> int:
         region_sizes = ds_database.get_region_sizes(x, y, p)
         total_size = sum(region_sizes.values())
         malloc_size = total_size + APP_PTR_TABLE_BYTE_SIZE
@@ -194,13 +202,17 @@ class _LoadDataSpecification(object):
         if (next_pointer != expected_pointer):
             raise DataSpecException(
                 f"For {x=} {y=} {p=} {next_pointer=} != {expected_pointer=}")
+        return start_address
 
     def __python_load_core(
             self, ds_database: DsSqlliteDatabase, x: int, y: int, p: int,
+            base_address: int, table_data: bytearray,
             writer: _Writer) -> int:
         written = 0
-        pointer_table = numpy.zeros(
-            MAX_MEM_REGIONS, dtype=TABLE_TYPE)
+        pointer_table = numpy.frombuffer(
+            table_data, dtype=TABLE_TYPE, count=MAX_MEM_REGIONS,
+            offset=APP_PTR_TABLE_HEADER_BYTE_SIZE)
+        pointer_table.fill(0)
         try:
             for region_num, pointer, content in \
                     ds_database.get_region_pointers_and_content(x, y, p):
@@ -209,15 +221,20 @@ class _LoadDataSpecification(object):
                 if content is None:
                     continue
 
-                writer(x, y, pointer, content)
                 n_bytes = len(content)
                 written += n_bytes
-                if n_bytes % BYTES_PER_WORD != 0:
-                    n_bytes += BYTES_PER_WORD - n_bytes % BYTES_PER_WORD
-                pointer_table[region_num]["n_words"] = n_bytes / BYTES_PER_WORD
-                n_data = numpy.array(content, dtype="uint8")
+                # Pad to a whole word before writing, so the words in SDRAM
+                # match the words counted and checksummed
+                padding = -n_bytes & (BYTES_PER_WORD - 1)
+                if padding:
+                    content += bytes(padding)
+                writer(x, y, pointer, content)
+                pointer_table[region_num]["n_words"] = \
+                    len(content) // BYTES_PER_WORD
+                # View the content as words without copying it
+                words = numpy.frombuffer(content, dtype="<u4")
                 pointer_table[region_num]["checksum"] = \
-                    int(numpy.sum(n_data.view("uint32"))) & 0xFFFFFFFF
+                    int(words.sum(dtype=numpy.uint64)) & 0xFFFFFFFF
 
         except TypeError:
             # pylint: disable=raise-missing-from, undefined-loop-variable
@@ -226,15 +243,8 @@ class _LoadDataSpecification(object):
                     f"{x=} {y=} {p=} {region_num=} has a unsatisfied pointer")
             raise
 
-        base_address = ds_database.get_start_address(x, y, p)
-        header = numpy.array([APPDATA_MAGIC_NUM, DSE_VERSION], dtype="<u4")
-
-        to_write = numpy.concatenate(
-            (header, pointer_table.view("uint32"))).tobytes()
-        if base_address is None:
-            logger.warning("here")
-        writer(x, y, base_address, to_write)
-        written += len(to_write)
+        writer(x, y, base_address, bytes(table_data))
+        written += len(table_data)
         return written
 
     def __malloc_region_storage(
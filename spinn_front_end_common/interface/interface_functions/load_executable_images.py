@@ -47,10 +47,11 @@ def load_sys_images() -> None:
     Go through the executable targets and load each binary to everywhere
     and then send a start request to the cores that actually use it.
     """
-    _load_images(lambda ty: ty is ExecutableType.SYSTEM,
-                 "Loading system executables onto the machine")
+    cores = _load_images(lambda ty: ty is ExecutableType.SYSTEM,
+                         "Loading system executables onto the machine")
+    if not cores.total_processors:
+        return
     try:
-        cores = filter_targets(lambda ty: ty is ExecutableType.SYSTEM)
         FecDataView.get_transceiver().wait_for_cores_to_be_in_state(
             cores.all_core_subsets, FecDataView.get_app_id(),
             _running_state, timeout=10)
@@ -60,13 +61,18 @@ def load_sys_images() -> None:
 
 
 def _load_images(
-        filter_predicate: Callable[[ExecutableType], bool], label: str):
+        filter_predicate: Callable[[ExecutableType], bool],
+        label: str) -> ExecutableTargets:
     """
     :param callable(ExecutableType,bool) filter_predicate:
     :param str label
+    :return: The targets that were loaded
+    :rtype: ~spinnman.model.ExecutableTargets
     """
     # Compute what work is to be done here
     cores = filter_targets(filter_predicate)
+    if not cores.total_processors:
+        return cores
 
     try:
         with ProgressBar(cores.total_processors + 1, label) as progress:
@@ -75,6 +81,7 @@ def _load_images(
 
             _start_simulation(cores, FecDataView.get_app_id())
             progress.update()
+        return cores
     except Exception as e:
         try:
 
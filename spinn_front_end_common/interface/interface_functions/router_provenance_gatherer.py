@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import logging
 from typing import Dict, Optional, Set
 from spinn_utilities.progress_bar import ProgressBar
@@ -23,6 +24,8 @@ from spinnman.model import RouterDiagnostics
 from pacman.model.routing_tables import AbstractMulticastRoutingTable
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.interface.provenance import ProvenanceWriter
+from spinn_front_end_common.utilities.scp import (
+    ReadRouterDiagnosticsForChipsProcess)
 from spinn_front_end_common.utilities.utility_objs import ReInjectionStatus
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -45,11 +48,17 @@ class _RouterProvenanceGatherer(object):
         """
         Writes the provenance data of the router diagnostics
         """
-        count = len(FecDataView.get_uncompressed().routing_tables) \
-            + FecDataView.get_machine().n_chips + 1
-        progress = ProgressBar(count, "Getting Router Provenance")
-
-        seen_chips: Set[XY] = set()
+        routing_tables = FecDataView.get_uncompressed().routing_tables
+        machine = FecDataView.get_machine()
+
+        # Read the chips with and without tables in the same wave of requests
+        table_coords: Set[XY] = {
+            (table.x, table.y) for table in routing_tables}
+        unseen = [
+            xy for xy in machine.chip_coordinates if xy not in table_coords]
+        progress = ProgressBar(
+            len(routing_tables) + len(unseen) + 1,
+            "Getting Router Provenance")
 
         # get all extra monitor core data if it exists
         reinjection_data: Optional[Dict[Chip, ReInjectionStatus]] = None
@@ -58,54 +67,63 @@ class _RouterProvenanceGatherer(object):
             reinjection_data = monitor.get_reinjection_status_for_vertices()
         progress.update()
 
-        for router_table in progress.over(
-                FecDataView.get_uncompressed().routing_tables, False):
-            seen_chips.add(self._add_router_table_diagnostic(
-                router_table, reinjection_data))
-
-        # Get what info we can for chips where there are problems or no table
-        for chip in progress.over(sorted(
-                FecDataView.get_machine().chips, key=lambda c: (c.x, c.y))):
-            if (chip.x, chip.y) not in seen_chips:
+        process = ReadRouterDiagnosticsForChipsProcess(
+            FecDataView.get_scamp_connection_selector())
+        diagnostics = process.get_router_diagnostics(
+            itertools.chain(table_coords, unseen))
+
+        for router_table in progress.over(routing_tables, False):
+            self._add_router_table_diagnostic(
+                router_table, diagnostics, process.failures,
+                reinjection_data)
+
+        # Try again to get what info we can for chips where there are problems
+        failed = [xy for xy in table_coords if xy not in diagnostics]
+        if failed:
+            retry = ReadRouterDiagnosticsForChipsProcess(
+                FecDataView.get_scamp_connection_selector())
+            for xy, chip_diagnostics in retry.get_router_diagnostics(
+                    failed).items():
                 self._add_unseen_router_chip_diagnostic(
-                    chip, reinjection_data)
+                    machine[xy], chip_diagnostics, reinjection_data)
 
-    def __get_router_diagnostics(self, chip: Chip) -> RouterDiagnostics:
-        return FecDataView.get_transceiver().get_router_diagnostics(
-            chip.x, chip.y)
+        # Get what info we can for chips with no table
+        for xy in progress.over(unseen):
+            # There could be issues with unused chips - don't worry!
+            if xy in diagnostics:
+                self._add_unseen_router_chip_diagnostic(
+                    machine[xy], diagnostics[xy], reinjection_data)
 
     def _add_router_table_diagnostic(
             self, table: AbstractMulticastRoutingTable,
-            reinjection_data: Optional[Dict[Chip, ReInjectionStatus]]) -> XY:
+            diagnostics: Dict[XY, RouterDiagnostics],
+            failures: Dict[XY, SpinnmanException],
+            reinjection_data: Optional[Dict[Chip, ReInjectionStatus]]):
         """
         :param ~.AbstractMulticastRoutingTable table:
+        :param dict(tuple(int,int),~.RouterDiagnostics) diagnostics:
+        :param dict(tuple(int,int),~.SpinnmanException) failures:
         :param dict(tuple(int,int),ReInjectionStatus) reinjection_data:
-        :rtype: Chip
         """
         chip = table.chip
-        try:
-            diagnostics = self.__get_router_diagnostics(chip)
-        except SpinnmanException:
+        chip_diagnostics = diagnostics.get((chip.x, chip.y))
+        if chip_diagnostics is None:
             logger.warning(
                 "Could not read routing diagnostics from {},{}",
-                chip.x, chip.y, exc_info=True)
-            return (-1, -1)  # Not a chip location
+                chip.x, chip.y, exc_info=failures.get((chip.x, chip.y)))
+            return
         status = self.__get_status(reinjection_data, chip)
-        self.__router_diagnostics(chip, diagnostics, status, True, table)
-        return chip.x, chip.y
+        self.__router_diagnostics(
+            chip, chip_diagnostics, status, True, table)
 
     def _add_unseen_router_chip_diagnostic(
-            self, chip: Chip,
+            self, chip: Chip, diagnostics: RouterDiagnostics,
             reinjection_data: Optional[Dict[Chip, ReInjectionStatus]]):
         """
         :param ~.Chip chip:
+        :param ~.RouterDiagnostics diagnostics:
         :param dict(Chip,ReInjectionStatus) reinjection_data:
         """
-        try:
-            diagnostics = self.__get_router_diagnostics(chip)
-        except SpinnmanException:
-            # There could be issues with unused chips - don't worry!
-            return
         if (diagnostics.n_dropped_multicast_packets or
                 diagnostics.n_local_multicast_packets or
                 diagnostics.n_external_multicast_packets):
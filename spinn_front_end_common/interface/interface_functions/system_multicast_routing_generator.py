@@ -14,7 +14,7 @@
 
 from collections import defaultdict
 import logging
-from typing import Dict, Tuple, Set, Optional, cast
+from typing import Dict, List, Tuple, Set, Optional, cast
 
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XY
@@ -87,29 +87,37 @@ class _SystemMulticastRoutingGenerator(object):
 
         for ethernet_chip in progress.over(
                 self._machine.ethernet_connected_chips):
-            tree = self._generate_routing_tree(ethernet_chip)
+            # The chips on the board are needed several times so get once
+            board_chips = list(self._machine.get_chips_by_ethernet(
+                ethernet_chip.x, ethernet_chip.y))
+            tree = self._generate_routing_tree(ethernet_chip, board_chips)
             if tree is None:
-                tree = self._logging_retry(ethernet_chip)
-            self._add_routing_entries(ethernet_chip, tree)
+                tree = self._logging_retry(ethernet_chip, board_chips)
+            self._add_routing_entries(ethernet_chip, board_chips, tree)
 
         return (self._routing_tables, self._key_to_destination_map,
                 self._time_out_keys_by_board)
 
     __LINK_ORDER = (1, 0, 2, 5, 3, 4)
 
-    def _generate_routing_tree(self, ethernet_chip: Chip) -> Optional[
-            Dict[Chip, Tuple[Chip, int]]]:
+    def _generate_routing_tree(
+            self, ethernet_chip: Chip, board_chips: List[Chip]) -> Optional[
+                Dict[Chip, Tuple[Chip, int]]]:
         """
         Generates a map for each chip to over which link it gets its data.
 
         :param ~spinn_machine.Chip ethernet_chip:
+        :param list(~spinn_machine.Chip) board_chips:
+            The chips on the board of the Ethernet-enabled chip
         :return: Map of chip to (source_chip, source_link)
         :rtype: dict(Chip, tuple(Chip, int))
         """
+        machine = self._machine
         tree: Dict[Chip, Tuple[Chip, int]] = dict()
-        to_reach = set(self._machine.get_chips_by_ethernet(
-            ethernet_chip.x, ethernet_chip.y))
-        to_reach.remove(ethernet_chip)
+        # Track what is left by coordinates so that only chips actually
+        # reached need to be looked up in the machine
+        to_reach = {(chip.x, chip.y) for chip in board_chips}
+        to_reach.remove((ethernet_chip.x, ethernet_chip.y))
         found = {ethernet_chip}
         while to_reach:
             just_reached: Set[Chip]
@@ -118,26 +126,24 @@ class _SystemMulticastRoutingGenerator(object):
                 # Check links starting with the most direct from 0,0
                 for link_id in self.__LINK_ORDER:
                     # Get potential destination
-                    destination = self._machine.get_chip_at(
-                        *self._machine.xy_over_link(
-                            chip.x, chip.y, link_id))
+                    xy = machine.xy_over_link(chip.x, chip.y, link_id)
                     # If destination is useful and link exists
-                    if destination in to_reach and (
-                            chip.router.is_link(link_id)):
+                    if xy in to_reach and chip.router.is_link(link_id):
                         # Add to tree and record chip reachable
+                        destination = machine[xy]
                         tree[destination] = (chip, link_id)
-                        to_reach.remove(destination)
+                        to_reach.remove(xy)
                         found.add(destination)
             if not found:
                 return None
         return tree
 
     def _logging_retry(
-            self, ethernet_chip: Chip) -> Dict[Chip, Tuple[Chip, int]]:
+            self, ethernet_chip: Chip,
+            board_chips: List[Chip]) -> Dict[Chip, Tuple[Chip, int]]:
         # pylint: disable=unsubscriptable-object
         tree: Dict[Chip, Tuple[Chip, int]] = dict()
-        to_reach = set(self._machine.get_chips_by_ethernet(
-            ethernet_chip.x, ethernet_chip.y))
+        to_reach = set(board_chips)
         to_reach.remove(ethernet_chip)
         found = {ethernet_chip}
         logger.warning("In _logging_retry")
@@ -202,7 +208,8 @@ class _SystemMulticastRoutingGenerator(object):
         table.add_multicast_routing_entry(entry)
 
     def _add_routing_entries(
-            self, ethernet_chip: Chip, tree: Dict[Chip, Tuple[Chip, int]]):
+            self, ethernet_chip: Chip, board_chips: List[Chip],
+            tree: Dict[Chip, Tuple[Chip, int]]):
         """
         Adds the routing entries based on the tree.
 
@@ -213,16 +220,20 @@ class _SystemMulticastRoutingGenerator(object):
 
         :param ~spinn_machine.Chip ethernet_chip:
             the Ethernet-enabled chip to make entries for
+        :param list(~spinn_machine.Chip) board_chips:
+            The chips on the board of the Ethernet-enabled chip
         :param dict(Chip,tuple(Chip,int)) tree:
             map of chips and links
         """
-        eth_x, eth_y = ethernet_chip.x, ethernet_chip.y
         key = KEY_START_VALUE
-        for chip in self._machine.get_chips_by_ethernet(eth_x, eth_y):
+        # The monitor core of each chip is needed twice so look it up once
+        monitor_cores: Dict[Chip, int] = dict()
+        for chip in board_chips:
             self._key_to_destination_map[chip.x, chip.y] = key
-            placement = FecDataView.get_placement_of_vertex(
-                FecDataView.get_monitor_by_chip(chip))
-            self._add_routing_entry(chip, key, processor_id=placement.p)
+            monitor_core = FecDataView.get_placement_of_vertex(
+                FecDataView.get_monitor_by_chip(chip)).p
+            monitor_cores[chip] = monitor_core
+            self._add_routing_entry(chip, key, processor_id=monitor_core)
             while chip in tree:
                 chip, link = tree[chip]
                 self._add_routing_entry(chip, key, link_ids=[link])
@@ -235,12 +246,9 @@ class _SystemMulticastRoutingGenerator(object):
             links_per_chip[chip].append(link)
 
         # add broadcast router timeout keys
-        time_out_key = key
-        for chip in self._machine.get_chips_by_ethernet(eth_x, eth_y):
-            placement = FecDataView.get_placement_of_vertex(
-                FecDataView.get_monitor_by_chip(chip))
+        for chip in board_chips:
             self._add_routing_entry(
-                chip, time_out_key, processor_id=placement.p,
+                chip, key, processor_id=monitor_cores[chip],
                 link_ids=links_per_chip[chip])
-            # update tracker
-            self._time_out_keys_by_board[eth_x, eth_y] = key
+        # update tracker
+        self._time_out_keys_by_board[ethernet_chip.x, ethernet_chip.y] = key
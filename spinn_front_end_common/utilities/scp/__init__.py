@@ -13,12 +13,18 @@
 # limitations under the License.
 
 from .clear_iobuf_process import ClearIOBUFProcess
+from .clear_router_diagnostic_counters_process import (
+    ClearRouterDiagnosticCountersProcess)
 from .load_mc_routes_process import LoadMCRoutesProcess
+from .read_router_diagnostics_for_chips_process import (
+    ReadRouterDiagnosticsForChipsProcess)
 from .reinjector_control_process import ReinjectorControlProcess
 from .update_runtime_process import UpdateRuntimeProcess
 
 __all__ = (
     "ClearIOBUFProcess",
+    "ClearRouterDiagnosticCountersProcess",
     "LoadMCRoutesProcess",
+    "ReadRouterDiagnosticsForChipsProcess",
     "ReinjectorControlProcess",
     "UpdateRuntimeProcess")
@@ -0,0 +1,47 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+from typing import Iterable
+from spinn_utilities.typing.coords import XY
+from spinnman.messages.scp.impl import CheckOKResponse, WriteMemory
+from spinnman.processes import AbstractMultiConnectionProcess
+
+#: The router register that clears the diagnostic counters when written
+_ROUTER_DIAGNOSTIC_CLEAR_ADDRESS = 0xf100002c
+#: The value that clears all the diagnostic counters
+_CLEAR_ALL_COUNTERS = struct.pack("<I", 0xFFFFFFFF)
+
+
+class ClearRouterDiagnosticCountersProcess(
+        AbstractMultiConnectionProcess[CheckOKResponse]):
+    """
+    How to clear the router diagnostic counters on a set of chips.
+
+    The requests are pipelined over the available connections rather than
+    waiting for each chip to reply in turn.
+    """
+    __slots__ = ()
+
+    def clear_router_diagnostic_counters(
+            self, chip_coordinates: Iterable[XY]):
+        """
+        :param iterable(tuple(int,int)) chip_coordinates:
+            The coordinates of the chips to clear the counters of
+        """
+        with self._collect_responses():
+            for x, y in chip_coordinates:
+                self._send_request(WriteMemory(
+                    (x, y, 0), _ROUTER_DIAGNOSTIC_CLEAR_ADDRESS,
+                    _CLEAR_ALL_COUNTERS))
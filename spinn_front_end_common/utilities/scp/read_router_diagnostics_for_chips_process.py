@@ -0,0 +1,136 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+from types import TracebackType
+from functools import partial
+from typing import Dict, Iterable, List
+from spinn_utilities.typing.coords import XY
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.constants import (
+    ROUTER_REGISTER_BASE_ADDRESS, ROUTER_REGISTER_REGISTERS)
+from spinnman.exceptions import SpinnmanException
+from spinnman.messages.scp.abstract_messages import AbstractSCPRequest
+from spinnman.messages.scp.impl.read_memory import ReadMemory, Response
+from spinnman.model import RouterDiagnostics
+from spinnman.processes import (
+    AbstractMultiConnectionProcess, ConnectionSelector)
+
+#: The address of the router control register
+_CONTROL_REGISTER_ADDRESS = ROUTER_REGISTER_BASE_ADDRESS
+#: The address of the router error status register
+_ERROR_STATUS_ADDRESS = ROUTER_REGISTER_BASE_ADDRESS + 0x14
+#: The address of the first router diagnostic counter
+_DIAGNOSTIC_REGISTERS_ADDRESS = ROUTER_REGISTER_BASE_ADDRESS + 0x300
+#: The number of router diagnostic counters
+_N_REGISTERS = len(ROUTER_REGISTER_REGISTERS)
+_ONE_WORD = struct.Struct("<I")
+_REGISTERS = struct.Struct(f"<{_N_REGISTERS}I")
+
+
+class ReadRouterDiagnosticsForChipsProcess(
+        AbstractMultiConnectionProcess[Response]):
+    """
+    How to read the router diagnostics from a set of chips.
+
+    The reads for all the chips are pipelined over the available connections
+    rather than waiting for each chip to reply in turn.  A chip that fails to
+    reply is recorded rather than stopping the reads of the other chips.
+    """
+    __slots__ = (
+        "_control_registers",
+        "_error_statuses",
+        "_failures",
+        "_register_values")
+
+    def __init__(self, connection_selector: ConnectionSelector):
+        """
+        :param ConnectionSelector connection_selector:
+        """
+        super().__init__(connection_selector)
+        self._control_registers: Dict[XY, int] = dict()
+        self._error_statuses: Dict[XY, int] = dict()
+        self._register_values: Dict[XY, List[int]] = dict()
+        self._failures: Dict[XY, SpinnmanException] = dict()
+
+    def __handle_control_register_response(
+            self, xy: XY, response: Response):
+        self._control_registers[xy] = _ONE_WORD.unpack_from(
+            response.data, response.offset)[0]
+
+    def __handle_error_status_response(self, xy: XY, response: Response):
+        self._error_statuses[xy] = _ONE_WORD.unpack_from(
+            response.data, response.offset)[0]
+
+    def __handle_register_response(self, xy: XY, response: Response):
+        self._register_values[xy] = list(_REGISTERS.unpack_from(
+            response.data, response.offset))
+
+    def __handle_error(
+            self, request: AbstractSCPRequest, exception: Exception,
+            tb: TracebackType, connection: SCAMPConnection):
+        if not isinstance(exception, SpinnmanException):
+            # Not a failure to talk to the chip, so report it as normal
+            self._receive_error(request, exception, tb, connection)
+            return
+        header = request.sdp_header
+        self._failures.setdefault(
+            (header.destination_chip_x, header.destination_chip_y),
+            exception)
+
+    def get_router_diagnostics(
+            self, chip_coordinates: Iterable[XY]) -> Dict[
+                XY, RouterDiagnostics]:
+        """
+        Read the router diagnostics of the given chips.
+
+        :param iterable(tuple(int,int)) chip_coordinates:
+            The coordinates of the chips to read the diagnostics of
+        :return: The diagnostics of each chip that replied
+        :rtype: dict(tuple(int,int), ~spinnman.model.RouterDiagnostics)
+        :raises ~spinnman.exceptions.SpinnmanException:
+            If something other than communicating with a chip went wrong
+        """
+        with self._collect_responses():
+            for xy in chip_coordinates:
+                coords = (*xy, 0)
+                self._send_request(
+                    ReadMemory(coords, _CONTROL_REGISTER_ADDRESS, 4),
+                    partial(self.__handle_control_register_response, xy),
+                    self.__handle_error)
+                self._send_request(
+                    ReadMemory(coords, _ERROR_STATUS_ADDRESS, 4),
+                    partial(self.__handle_error_status_response, xy),
+                    self.__handle_error)
+                self._send_request(
+                    ReadMemory(
+                        coords, _DIAGNOSTIC_REGISTERS_ADDRESS,
+                        _N_REGISTERS * 4),
+                    partial(self.__handle_register_response, xy),
+                    self.__handle_error)
+
+        return {
+            xy: RouterDiagnostics(
+                control, self._error_statuses[xy], self._register_values[xy])
+            for xy, control in self._control_registers.items()
+            if xy not in self._failures}
+
+    @property
+    def failures(self) -> Dict[XY, SpinnmanException]:
+        """
+        The chips that could not be read, each with the first error seen.
+
+        :rtype: dict(tuple(int,int), ~spinnman.exceptions.SpinnmanException)
+        """
+        return self._failures
@@ -68,7 +68,8 @@ class SQLiteDB(object):
                 Type[sqlite3.Row], Type[tuple]]] = sqlite3.Row,
             text_factory: Optional[Union[
                 Type[memoryview], Type[str]]] = memoryview,
-            case_insensitive_like: bool = True, timeout: float = 5.0):
+            case_insensitive_like: bool = True, timeout: float = 5.0,
+            synchronous: bool = True):
         """
         :param str database_file:
             The name of a file that contains (or will contain) an SQLite
@@ -103,8 +104,10 @@ class SQLiteDB(object):
             `OperationalError` when a table is locked. If another connection
             opens a transaction to modify a table, that table will be locked
             until the transaction is committed. Default five seconds.
-        :param Synchronisation synchronisation:
-            The synchronisation level. Doesn't normally need to be altered.
+        :param bool synchronous:
+            Whether a commit waits for the data to reach the disk. This is a
+            setting of the connection, so is applied every time the database
+            is opened. Doesn't normally need to be altered.
         """
         self.__db = None
         self.__cursor = None
@@ -143,6 +146,8 @@ class SQLiteDB(object):
             self.__pragma("user_version", ddl_hash)
         if case_insensitive_like:
             self.__pragma("case_sensitive_like", False)
+        if not synchronous:
+            self.__pragma("synchronous", False)
         # Official recommendations!
         self.__pragma("foreign_keys", True)
         self.__pragma("recursive_triggers", True)
@@ -210,6 +210,30 @@ class TestSimulatorData(unittest.TestCase):
             FecDataView.get_hardware_time_step_us()
         self.assertFalse(view.has_time_step())
 
+    def test_automatic_time_scale_factor(self):
+        writer = FecDataWriter.setup()
+        # 1000 / 300 rounded up
+        writer.set_up_timings(300, None)
+        self.assertEqual(4, FecDataView.get_time_scale_factor())
+        self.assertIsInstance(FecDataView.get_time_scale_factor(), int)
+        self.assertEqual(1200, FecDataView.get_hardware_time_step_us())
+
+        writer.set_up_timings(1000, None)
+        self.assertEqual(1, FecDataView.get_time_scale_factor())
+        self.assertIsInstance(FecDataView.get_time_scale_factor(), int)
+
+        # Never below real time
+        writer.set_up_timings(2000, None)
+        self.assertEqual(1, FecDataView.get_time_scale_factor())
+        self.assertIsInstance(FecDataView.get_time_scale_factor(), int)
+        self.assertEqual(2000, FecDataView.get_hardware_time_step_us())
+
+        # A float factor still gives an integer hardware step
+        writer.set_up_timings(500, 2.5)
+        self.assertEqual(1250, FecDataView.get_hardware_time_step_us())
+        with self.assertRaises(ConfigurationException):
+            writer.set_up_timings(333, 1.5)
+
     def test_directories_normal(self):
         writer = FecDataWriter.setup()
         report_dir = writer.get_report_dir_path()
@@ -161,6 +161,37 @@ class TestLoadDataSpecification(unittest.TestCase):
             self.assertEqual(db.get_memory_to_write(0, 0, 0),
                              header_and_table_size + 16)
 
+    def test_content_not_whole_words(self):
+        writer = FecDataWriter.mock()
+        transceiver = _MockTransceiver()
+        writer.set_transceiver(transceiver)
+
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.USES_SIMULATION_INTERFACE)
+        with DsSqlliteDatabase() as db:
+            spec = DataSpecificationGenerator(0, 0, 0, vertex, db)
+            spec.reserve_memory_region(0, 100)
+            spec.end_specification()
+            # The generator only writes whole words, so go direct
+            db.set_region_content(0, 0, 0, 0, bytes([1, 2, 3, 4, 5, 6]), None)
+
+        load_application_data_specs()
+
+        header_and_table_size = ((MAX_MEM_REGIONS * 3) + 2) * BYTES_PER_WORD
+        regions = transceiver.regions_written
+        self.assertEqual(len(regions), 3)
+
+        # The region is padded with zeros to a whole number of words
+        self.assertEqual(regions[1][0], header_and_table_size)
+        self.assertEqual(
+            bytes(regions[1][1]), bytes([1, 2, 3, 4, 5, 6, 0, 0]))
+
+        # The table counts and checksums the padded words
+        table = struct.unpack(f"<{len(regions[2][1]) // 4}I", regions[2][1])
+        self.assertEqual(table[2], header_and_table_size)
+        self.assertEqual(table[3], 0x04030201 + 0x00000605)
+        self.assertEqual(table[4], 2)
+
     def test_multi_spec_with_references(self):
         writer = FecDataWriter.mock()
         transceiver = _MockTransceiver()
@@ -234,6 +265,16 @@ class TestLoadDataSpecification(unittest.TestCase):
         self.assertEqual(header_data[0][2 * 3], header_data[1][2 * 3])
         self.assertEqual(header_data[2][2 * 3], header_data[1][2 * 3])
 
+        # Each core has its own table: all point region 0 at the region
+        # after core 1's table, but only core 1 wrote any words to it
+        self.assertEqual(
+            base_addresses[1] + header_and_table_size, header_data[1][2])
+        self.assertEqual(header_data[0][2], header_data[1][2])
+        self.assertEqual(header_data[2][2], header_data[1][2])
+        self.assertEqual(1, header_data[1][4])
+        self.assertEqual(0, header_data[0][4])
+        self.assertEqual(0, header_data[2][4])
+
     def test_multispec_with_reference_error(self):
         writer = FecDataWriter.mock()
         transceiver = _MockTransceiver()
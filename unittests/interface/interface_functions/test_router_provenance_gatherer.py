@@ -0,0 +1,145 @@
+# Copyright (c) 2023 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import defaultdict, deque
+import struct
+import unittest
+from testfixtures.logcapture import LogCapture  # type: ignore[import]
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+from spinn_machine.virtual_machine import virtual_machine
+from spinnman.messages.scp.enums import SCPResult
+from spinnman.processes import FixedConnectionSelector
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+from pacman.model.routing_tables import (
+    MulticastRoutingTables, UnCompressedMulticastRoutingTable)
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.interface.interface_functions import (
+    router_provenance_gatherer)
+from spinn_front_end_common.interface.provenance import ProvenanceReader
+
+_DIAGNOSTIC_REGISTERS_ADDRESS = 0xe1000300
+_LOGGER = (
+    "spinn_front_end_common.interface.interface_functions."
+    "router_provenance_gatherer")
+
+
+class _MockConnection(object):
+    """
+    Answers reads of router registers, failing the first few reads of each
+    register on the chips it is told are broken.
+    """
+
+    def __init__(self, failures):
+        """
+        :param dict(tuple(int,int),int) failures:
+            How many times each read should fail on each broken chip
+        """
+        self._failures = defaultdict(int)
+        for xy, n_failures in failures.items():
+            self._failures[xy] = n_failures
+        self._failed = defaultdict(int)
+        self._responses = deque()
+
+    def is_ready_to_receive(self, timeout=0):
+        return bool(self._responses)
+
+    def get_scp_data(self, request):
+        request.sdp_header.update_for_send(0, 0)
+        header = request.sdp_header
+        xy = (header.destination_chip_x, header.destination_chip_y)
+        address = request.argument_1
+        sequence = request.scp_request_header.sequence
+        response = struct.pack("<2x") + header.bytestring
+        if self._failed[xy, address] < self._failures[xy]:
+            self._failed[xy, address] += 1
+            response += struct.pack(
+                "<2H", SCPResult.RC_ROUTE.value, sequence)
+        elif address == _DIAGNOSTIC_REGISTERS_ADDRESS:
+            # One local multicast packet and nothing else
+            response += struct.pack(
+                "<2H16I", SCPResult.RC_OK.value, sequence, 1, *([0] * 15))
+        else:
+            response += struct.pack("<2HI", SCPResult.RC_OK.value, sequence, 0)
+        self._responses.append(response)
+        return b""
+
+    def send(self, data):
+        pass
+
+    def receive_scp_response(self, timeout=1.0):
+        data = self._responses.popleft()
+        result, sequence = struct.unpack_from("<2H", data, 10)
+        return SCPResult(result), sequence, data, 2
+
+
+class _MockTransceiver(MockableTransceiver):
+
+    def __init__(self, connection):
+        self._selector = FixedConnectionSelector(connection)
+
+    @overrides(MockableTransceiver.get_scamp_connection_selector)
+    def get_scamp_connection_selector(self):
+        return self._selector
+
+
+class TestRouterProvenanceGatherer(unittest.TestCase):
+
+    def setUp(self):
+        unittest_setup()
+        set_config("Machine", "version", 5)
+
+    def test_failed_reads(self):
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine(8, 8))
+        writer.set_uncompressed(MulticastRoutingTables([
+            UnCompressedMulticastRoutingTable(0, 0),
+            UnCompressedMulticastRoutingTable(1, 0),
+            UnCompressedMulticastRoutingTable(1, 1)]))
+        # (1, 0) has a table and fails only the first time it is read;
+        # (1, 1) has a table and (0, 1) has none, and both always fail
+        writer.set_transceiver(_MockTransceiver(_MockConnection({
+            (1, 0): 1, (1, 1): 10, (0, 1): 10})))
+
+        with LogCapture() as lc:
+            router_provenance_gatherer()
+        warnings = [
+            record for record in lc.records if record.name == _LOGGER]
+        self.assertEqual(1, len(warnings))
+        self.assertIn("1,1", warnings[0].getMessage())
+        self.assertIsNotNone(warnings[0].exc_info)
+
+        with ProvenanceReader() as db:
+            expected = {
+                (x, y): bool(is_expected) for x, y, is_expected in
+                db.run_query(
+                    """
+                    SELECT x, y, expected FROM router_provenance
+                    WHERE description = 'Local_Multicast_Packets'
+                    """)}
+        # The chip read first time is expected, the retried one is not
+        self.assertTrue(expected[0, 0])
+        self.assertFalse(expected[1, 0])
+        # The chips that could not be read are skipped
+        self.assertNotIn((1, 1), expected)
+        self.assertNotIn((0, 1), expected)
+        # The other chips of the board have no table, but did have traffic
+        self.assertEqual(
+            writer.get_machine().n_chips - 2, len(expected))
+        self.assertFalse(expected[2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()